@@ -139,6 +139,25 @@ class GetCheckpointTest(TestCase):
         self.assertIsNone(ch)
         self.assertEqual(error_msg, "Checkpoint already matched")
 
+    def test_abandon_checkpoint_matched_after_lookup(self):
+        ch, error_msg = checkpoint.get_checkpoint(self.abandon.unique_id)
+        self.assertEqual(ch, self.abandon)
+        self.assertIsNone(error_msg)
+
+        self.abandon.status = 1
+        self.abandon.save()
+
+        ch, error_msg = checkpoint.get_checkpoint(self.abandon.unique_id)
+        self.assertIsNone(ch)
+        self.assertEqual(error_msg, "Checkpoint already matched")
+
+    def test_non_existent_repeated(self):
+        unique_id = uuid.uuid4()
+        for _ in range(2):
+            ch, error_msg = checkpoint.get_checkpoint(unique_id)
+            self.assertIsNone(ch)
+            self.assertEqual(error_msg, "Checkpoint does not exist")
+
     def test_valid(self):
         ch, error_msg = checkpoint.get_checkpoint(self.match.unique_id)
         self.assertEqual(ch, self.match)
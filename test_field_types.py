@@ -50,6 +50,18 @@ class RangeFieldTest(TestCase):
         ):
             field_types.RangeField().validate(15, step)
 
+    def test_value_after_options_change(self):
+        step = mommy.make("questions.QuestionField", data={"start": 5, "end": 10})
+        field_types.RangeField().validate(7, step)
+
+        step.data = {"start": 5, "end": 6}
+        step.save()
+
+        with self.assertRaisesMessage(
+            ValidationError, "7 is greater than the maximum of 6"
+        ):
+            field_types.RangeField().validate(7, step)
+
 
 class SingleSelectFieldTest(TestCase):
     def test_get_value_schema(self):
@@ -411,6 +411,11 @@ class RecapAnswerTest(TestCase):
         recap = {"question": {"*": "sample text"}}
         self.assertEqual(services.recap_answers(answers, recap), ["sample text"])
 
+    def test_recap_answer_before_wildcard(self):
+        answers = {"question": "single answer"}
+        recap = {"question": {"single answer": "sample text", "*": "other text"}}
+        self.assertEqual(services.recap_answers(answers, recap), ["sample text"])
+
     @mock.patch("app.questions.services.logger")
     def test_recap_maintain_answer(self, p_logger):
         answers = {"question": "single answer"}
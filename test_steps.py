@@ -101,6 +101,23 @@ class StepValidatorTest(TestCase):
             },
         )
 
+    def test_is_valid_after_field_change(self):
+        answers = {
+            "f_1": 15,
+        }
+        step_validator = steps.StepValidator(self.step, answers)
+        self.assertFalse(step_validator.is_valid())
+
+        self.field_1.data = {
+            "start": 5,
+            "end": 20,
+        }
+        self.field_1.save()
+
+        step_validator = steps.StepValidator(self.step, answers)
+        self.assertTrue(step_validator.is_valid())
+        self.assertEqual(step_validator.errors, {})
+
 
 class IsEmailSubscription(TestCase):
     def test_for_retirement_living_host(self):